@@ -2,16 +2,16 @@
 
 # flake8: noqa F401
 from collections.abc import Callable
-from typing import Optional, Any
+from typing import Optional, Any, ClassVar
 
 import random
+from math import atan2, degrees
 
 import numpy as np
 
 from vendeeglobe import Heading, Instructions, Location
 
-from enum import Enum
-
+from enum import IntEnum
 
 NAV_LOCATIONS = [
     Location(-80.0, 9.6),
@@ -31,70 +31,164 @@ NAV_LOCATIONS = [
     None,
 ]
 
-
-class NavLatitudes(float, Enum):
-    AMERICAS = -22.0
-    CENTRAL_AMERICA = -65.8
-    OCEANIA_ONE = -160.2
-    SOUTH_AUSTRALIA = 180.0
-    SOUTH_WEST_AUSTRALIA = 133.0
-    INDIAN_OCEAN = 100.0
-    INDIAN_OCEAN_TWO = 90.0
-    ARABIAN_SEA = 60.0
-    RED_SEA = 40.0
-    RED_SEA_TWO = 35.0
-    MEDITTERANEAN = 31.4
-    MEDITTERANEAN_TWO = 12.7
-    MEDITTERANEAN_THREE = 11.3
-    MEDITTERANEAN_FOUR = -3.9
-    GIBRALTAR = -6.2
-    PORTUGAL = -10.2
-    FRANCE = -9.9
-
-
-class Turn(Enum):
+# Kinds of NAV_LOCATIONS entry
+NAV_END = 0
+NAV_TARGET = 1
+NAV_HEADING = 2
+
+# NAV_LOCATIONS as parallel tuples of one type each, so run and coord_navigate
+# index instead of type-test; entries of another kind hold None or 0.0
+NAV_KINDS = tuple(
+    NAV_END if nav is None else NAV_HEADING if isinstance(nav, float) else NAV_TARGET
+    for nav in NAV_LOCATIONS
+)
+NAV_TARGETS = tuple(nav if isinstance(nav, Location) else None for nav in NAV_LOCATIONS)
+NAV_LONS = tuple(
+    nav.longitude if isinstance(nav, Location) else 0.0 for nav in NAV_LOCATIONS
+)
+NAV_LATS = tuple(
+    nav.latitude if isinstance(nav, Location) else 0.0 for nav in NAV_LOCATIONS
+)
+NAV_HEADINGS = tuple(nav if isinstance(nav, float) else 0.0 for nav in NAV_LOCATIONS)
+
+
+# Landmark longitudes, in tenths of a degree
+AMERICAS = -220
+CENTRAL_AMERICA = -658
+OCEANIA_ONE = -1602
+SOUTH_AUSTRALIA = 1800
+SOUTH_WEST_AUSTRALIA = 1330
+INDIAN_OCEAN = 1000
+INDIAN_OCEAN_TWO = 900
+ARABIAN_SEA = 600
+RED_SEA = 400
+RED_SEA_TWO = 350
+MEDITTERANEAN = 314
+MEDITTERANEAN_TWO = 127
+MEDITTERANEAN_THREE = 113
+MEDITTERANEAN_FOUR = -39
+GIBRALTAR = -62
+PORTUGAL = -102
+FRANCE = -99
+
+# Degrees to turn away from a stuck heading when sailing back
+_UNSTICK_CHOICES = (135.0, 225.0)
+
+
+class Turn(IntEnum):
     NO = 0
     RIGHT = 1
     LEFT = 2
 
 
+def _tack_heading(intended: float, turn: Turn, last_turn: Turn) -> tuple[float, Turn]:
+    """
+    Heading 45 degrees off intended towards turn, and the side actually taken.
+
+    Wanting to turn the same way as last time tacks to the other side instead.
+    """
+    if turn == last_turn:
+        turn = Turn.RIGHT if turn == Turn.LEFT else Turn.LEFT
+    if turn == Turn.LEFT:
+        return (intended + 45.0) % 360.0, turn
+    return (intended - 45.0) % 360.0, turn
+
+
 class Bot:
     """
     This is the ship-controlling bot that will be instantiated for the competition.
     """
 
-    intended_heading: float
+    __slots__ = (
+        "team",
+        "_intended_heading",
+        "tack_within_degrees",
+        "tack_time_hours",
+        "time_adjusted",
+        "last_turn",
+        "tack",
+        "no_tack_zone",
+        "coord_navigation",
+        "current_nav_location",
+        "nav_location_reached",
+        "_prev_pos",
+        "_unstick_active",
+        "_unstick_back",
+        "_unstick_turn",
+        "_unstick_time",
+        "_turn_above",
+        "_turn_below",
+    )
+
+    team: str
+    _intended_heading: float
     tack_within_degrees: float
+    tack_time_hours: float
     time_adjusted: Optional[float]
     last_turn: Turn
-    course_plan: dict[Any, Any]
-    actual_course: dict[Any, Any]
     tack: bool
     no_tack_zone: bool
     coord_navigation: bool
     current_nav_location: int
     nav_location_reached: bool
-    previous_lat: float
-    previous_long: float
-    unstick_mode: dict[Any, Any]
+    _prev_pos: tuple[float, float]
+    _unstick_active: bool
+    _unstick_back: float
+    _unstick_turn: float
+    _unstick_time: float
+    _turn_above: float
+    _turn_below: float
+
+    # (longitude in tenths, intended heading) -> (intended heading, coord navigation,
+    # nav location, no tack zone) to switch to there; None leaves it as is
+    _TRANSITIONS: ClassVar[dict[tuple[int, float], tuple[Any, ...]]] = {
+        (AMERICAS, 180.0): (220.0, None, None, None),
+        (CENTRAL_AMERICA, 220.0): (180.0, True, None, None),
+        (OCEANIA_ONE, 190.0): (250.0, None, None, None),
+        (SOUTH_AUSTRALIA, 250.0): (180.0, None, None, None),
+        (SOUTH_WEST_AUSTRALIA, 180.0): (130.0, None, None, None),
+        (INDIAN_OCEAN, 130.0): (180.0, None, None, None),
+        (INDIAN_OCEAN_TWO, 180.0): (None, True, 4, None),
+        (ARABIAN_SEA, 120.0): (None, True, 6, None),
+        (RED_SEA, 116.0): (120.0, None, None, True),
+        (RED_SEA_TWO, 120.0): (None, True, 9, None),
+        (MEDITTERANEAN, 120.0): (170.0, None, None, False),
+        (MEDITTERANEAN_TWO, 170.0): (117.0, None, None, None),
+        (MEDITTERANEAN_THREE, 117.0): (187.7, None, None, None),
+        (MEDITTERANEAN_FOUR, 187.0): (None, True, 11, None),
+        (GIBRALTAR, 190.0): (170.0, None, None, None),
+        (PORTUGAL, 170.0): (89.0, None, None, None),
+        (FRANCE, 89.0): (None, True, 13, None),
+    }
 
     def __init__(self):
         self.team = "Big Brain Boat"  # This is your team name
-        self.intended_heading = 180.0
         self.tack_within_degrees = 45.0
+        self.intended_heading = 180.0
         self.tack_time_hours = 6.0
         self.time_adjusted = None
         self.last_turn = Turn.NO
-        self.course_plan = {NavLatitudes.AMERICAS: {"N": 90.0, "S": 250.0}}
-        self.actual_course = {NavLatitudes.AMERICAS: {}}
         self.tack = True
         self.no_tack_zone = False
         self.coord_navigation = False
         self.current_nav_location = 0
         self.nav_location_reached = False
-        self.previous_lat = 0.0
-        self.previous_long = 0.0
-        self.unstick_mode = {}
+        # (latitude, longitude) seen on the last tick we weren't unsticking
+        self._prev_pos = (0.0, 0.0)
+        self._unstick_active = False
+        self._unstick_back = 0.0
+        self._unstick_turn = 0.0
+        self._unstick_time = 0.0
+
+    @property
+    def intended_heading(self) -> float:
+        """Heading to hold; setting it also recomputes the tack wind window"""
+        return self._intended_heading
+
+    @intended_heading.setter
+    def intended_heading(self, value: float) -> None:
+        self._intended_heading = value
+        self._recompute_bounds()
 
     def run(
         self,
@@ -154,77 +248,63 @@ class Bot:
             Optionally, a sail value between 0 and 1 can be set.
         """
 
-        if NAV_LOCATIONS[self.current_nav_location] is None:
-            instructions = Instructions(sail=0)
-            return instructions
-        current_position_forecast = forecast(
-            latitudes=latitude, longitudes=longitude, times=0
-        )
-
-        wind_heading = self.wind_heading(*current_position_forecast)
-
-        # print(
-        #     f"{np.round(t, 2)} :: long: {np.round(longitude, 1)}, lat: {np.round(latitude, 1)}. Tack: {self.tack}"
-        # )
-        # Initialize the instructions
+        if NAV_KINDS[self.current_nav_location] == NAV_END:
+            return Instructions(sail=0)
+        # The engine may pass NumPy scalars; keep native floats in the stuck-check
+        # tuple and for the longitude/arrival arithmetic below
+        longitude = float(longitude)
+        latitude = float(latitude)
+        pos = (latitude, longitude)
         instructions = Instructions()
-        instructions.heading = Heading(self.intended_heading)
         instructions.sail = 1
-        if (
-            latitude == self.previous_lat
-            and longitude == self.previous_long
-            or self.unstick_mode
-        ):
-            # print("Trying to unstick")
-            self.unstick(heading, np.round(t, 1))
-            if t > self.unstick_mode["time"] and t < self.unstick_mode["time"] + 2.0:
-                # print(f"Sailing back to {self.unstick_mode['back']}")
-                instructions.heading = Heading(self.unstick_mode["back"])
-                # print(f"Instructions: {instructions}")
+        if pos == self._prev_pos or self._unstick_active:
+            # Not builtin round(): sums of dt like 0.35 round the other way there,
+            # which moves the manoeuvre's start by 0.1 h
+            self.unstick(heading, float(np.round(t, 1)))
+            # Two hours sailing back, then two hours at an angle
+            # Compare t with start + offset, not t - start with the offset: the two
+            # round differently for t built up from dt, which moves the window edges
+            start = self._unstick_time
+            if start < t < start + 2.0:
+                instructions.heading = Heading(self._unstick_back)
                 return instructions
-            elif (
-                t > self.unstick_mode["time"] + 2.0
-                and t < self.unstick_mode["time"] + 4.0
-            ):
-                # print(f"Sailing angled to {self.unstick_mode['turn']}")
-                instructions.heading = Heading(self.unstick_mode["turn"])
+            elif start + 2.0 < t < start + 4.0:
+                instructions.heading = Heading(self._unstick_turn)
                 return instructions
             else:
-                # print("Are we unstuck yet?")
-                self.unstick_mode = {}
+                self._unstick_active = False
                 self.tack = True
 
-        self.previous_long = longitude
-        self.previous_lat = latitude
+        self._prev_pos = pos
 
         if self.coord_navigation:
             if self.coord_navigate(instructions, longitude, latitude):
-                # print(f"Navigating to {instructions}")
                 return instructions
 
+        # Unstick and coord navigation never look at the wind, so ask for it only now
+        current_position_forecast = forecast(
+            latitudes=latitude, longitudes=longitude, times=0
+        )
+        wind_heading = self.wind_heading(*current_position_forecast)
+
+        # The early returns above set their own heading, so assign it once here
         if self.tack and not self.no_tack_zone:
-            if correction := self.catch_wind(heading, wind_heading, t):
-                instructions.heading = correction
-
-        # if np.round(longitude, 1) == -20.0 and self.intended_heading != 90.0:
-        #     print("Turning north")
-        #     self.intended_heading = 90.0
-        self.navigate(np.round(latitude, 1), np.round(longitude, 1), wind_heading)
-        # print(f"Instructions: {instructions}")
+            instructions.heading = self.catch_wind(heading, wind_heading, t)
+        else:
+            instructions.heading = Heading(self._intended_heading)
+
+        long_q = int(longitude * 10.0 + (0.5 if longitude >= 0.0 else -0.5))
+        self.navigate(latitude, long_q, wind_heading)
         return instructions
 
     def unstick(self, current_heading: float, time: float):
-        if self.unstick_mode:
-            # print("unstick already set")
+        if self._unstick_active:
             return
         self.tack = False
-        self.unstick_mode["back"] = self.minus_wrap(
-            current_heading, random.choice([135.0, 225.0])
-        )
-        self.unstick_mode["turn"] = self.plus_wrap(
-            self.minus_wrap(current_heading, 180.0), 90.0
-        )
-        self.unstick_mode["time"] = time
+        self._unstick_back = (current_heading - random.choice(_UNSTICK_CHOICES)) % 360.0
+        self._unstick_turn = (current_heading - 180.0 + 90.0) % 360.0
+        self._unstick_time = time
+        self._unstick_active = True
 
     def coord_navigate(
         self, instructions: Instructions, longitude: float, latitude: float
@@ -232,80 +312,42 @@ class Bot:
         """returns True to continue coord_navigating, False to resume heading navigation"""
         instructions.heading = None
 
-        if not isinstance(NAV_LOCATIONS[self.current_nav_location], float):
-            # print(f"Not a float: {NAV_LOCATIONS[self.current_nav_location]}")
-            instructions.location = NAV_LOCATIONS[self.current_nav_location]
+        nav_index = self.current_nav_location
+        if NAV_KINDS[nav_index] != NAV_HEADING:
+            instructions.location = NAV_TARGETS[nav_index]
         else:
-            # print(f"Float: {NAV_LOCATIONS[self.current_nav_location]}")
+            nav_heading = NAV_HEADINGS[nav_index]
             self.nav_location_reached = False
             instructions.location = None
             self.coord_navigation = False
-            self.intended_heading = NAV_LOCATIONS[self.current_nav_location]
-            instructions.heading = Heading(self.intended_heading)
+            self.intended_heading = nav_heading
+            instructions.heading = Heading(nav_heading)
             return False
         if self.nav_location_reached:
-            # print(f"Reached {Location(np.round(longitude, 1), np.round(latitude, 1))}")
-            self.current_nav_location += 1
+            self.current_nav_location = nav_index + 1
             self.nav_location_reached = False
         else:
+            # Within half a rounding step of the target, i.e. equal to it at 0.1 deg
             self.nav_location_reached = (
-                Location(np.round(longitude, 1), np.round(latitude, 1))
-                == NAV_LOCATIONS[self.current_nav_location]
+                abs(longitude - NAV_LONS[nav_index]) < 0.05
+                and abs(latitude - NAV_LATS[nav_index]) < 0.05
             )
         return True
 
-    def navigate(self, lat: float, long: float, wind_heading: float) -> None:
-        if long == NavLatitudes.AMERICAS and self.intended_heading == 180.0:
-            # print("Checking prevailing wind direction")
-            self.intended_heading = 220.0
-        # elif (
-        #     long == NavLatitudes.CENTRAL_AMERICA_ONE and self.intended_heading == 200.0
-        # ):
-        #     self.intended_heading = 180.0
-        elif long == NavLatitudes.CENTRAL_AMERICA and self.intended_heading == 220.0:
-            self.intended_heading = 180.0
-            self.coord_navigation = True
-        elif long == NavLatitudes.OCEANIA_ONE and self.intended_heading == 190.0:
-            self.intended_heading = 250.0
-        elif long == NavLatitudes.SOUTH_AUSTRALIA and self.intended_heading == 250.0:
-            self.intended_heading = 180.0
-        elif (
-            long == NavLatitudes.SOUTH_WEST_AUSTRALIA and self.intended_heading == 180.0
-        ):
-            self.intended_heading = 130.0
-        elif long == NavLatitudes.INDIAN_OCEAN and self.intended_heading == 130.0:
-            self.intended_heading = 180.0
-        elif long == NavLatitudes.INDIAN_OCEAN_TWO and self.intended_heading == 180.0:
-            self.coord_navigation = True
-            self.current_nav_location = 4
-        elif long == NavLatitudes.ARABIAN_SEA and self.intended_heading == 120.0:
-            self.coord_navigation = True
-            self.current_nav_location = 6
-        elif long == NavLatitudes.RED_SEA and self.intended_heading == 116.0:
-            self.intended_heading = 120.0
-            self.no_tack_zone = True
-        elif long == NavLatitudes.RED_SEA_TWO and self.intended_heading == 120.0:
-            self.coord_navigation = True
-            self.current_nav_location = 9
-        elif long == NavLatitudes.MEDITTERANEAN and self.intended_heading == 120.0:
-            self.no_tack_zone = False
-            self.intended_heading = 170.0
-        elif long == NavLatitudes.MEDITTERANEAN_TWO and self.intended_heading == 170.0:
-            self.intended_heading = 117.0
-        elif (
-            long == NavLatitudes.MEDITTERANEAN_THREE and self.intended_heading == 117.0
-        ):
-            self.intended_heading = 187.7
-        elif long == NavLatitudes.MEDITTERANEAN_FOUR and self.intended_heading == 187.0:
-            self.coord_navigation = True
-            self.current_nav_location = 11
-        elif long == NavLatitudes.GIBRALTAR and self.intended_heading == 190.0:
-            self.intended_heading = 170.0
-        elif long == NavLatitudes.PORTUGAL and self.intended_heading == 170.0:
-            self.intended_heading = 89.0
-        elif long == NavLatitudes.FRANCE and self.intended_heading == 89.0:
-            self.coord_navigation = True
-            self.current_nav_location = 13
+    def navigate(self, lat: float, long_q: int, wind_heading: float) -> None:
+        """long_q is the longitude in tenths of a degree, like the landmark constants"""
+        transition = self._TRANSITIONS.get((long_q, self._intended_heading))
+        if transition is None:
+            return
+        intended_heading, coord_navigation, nav_location, no_tack_zone = transition
+        if intended_heading is not None:
+            self.intended_heading = intended_heading
+        if coord_navigation is not None:
+            self.coord_navigation = coord_navigation
+        if nav_location is not None:
+            self.current_nav_location = nav_location
+        if no_tack_zone is not None:
+            self.no_tack_zone = no_tack_zone
 
     def should_turn(
         self,
@@ -314,28 +356,14 @@ class Bot:
         turn_below_heading: float,
         current_heading: float,
     ) -> Turn:
-        if (
-            wind_heading > turn_above_heading
-            and wind_heading < turn_below_heading
-            and self.within_acceptable_deviation(current_heading)
-        ):
-            # print(
-            #     f"Should turn left or tack right: {wind_heading} > {turn_above_heading} and {wind_heading} < {turn_below_heading} and {current_heading} <=> {self.intended_heading}"
-            # )
-            return Turn.LEFT
-        elif (
-            wind_heading < turn_above_heading
-            and wind_heading > turn_below_heading
-            and current_heading != self.intended_heading
-        ):
-            # print(
-            #     f"Should turn right or tack left: {wind_heading} < {turn_above_heading} and {wind_heading} > {turn_below_heading} and {current_heading} <=> {self.intended_heading}"
-            # )
-            return Turn.RIGHT
-
-        # print(
-        #     f"Should not turn: Wind: {wind_heading} Turn above: {turn_above_heading} Turn below: {turn_below_heading} Current: {current_heading} Intended: {self.intended_heading}"
-        # )
+        # The two wind windows are disjoint, so at most one range test can
+        # hold; the heading check only runs once the wind is in that window.
+        if turn_above_heading < wind_heading < turn_below_heading:
+            if self.within_acceptable_deviation(current_heading):
+                return Turn.LEFT
+        elif turn_below_heading < wind_heading < turn_above_heading:
+            if current_heading != self._intended_heading:
+                return Turn.RIGHT
         return Turn.NO
 
     def catch_wind(
@@ -343,127 +371,55 @@ class Bot:
         current_heading: float,
         wind_heading: float,
         timestamp: float,
-    ) -> Optional[Heading]:
+    ) -> Heading:
         """
         Turn to catch the wind if we're sailing too much against it
 
         Returns the new Heading to follow (max within 30 degrees of current)
         """
 
-        turn_below_heading = self.plus_wrap(
-            self.plus_wrap(180.0, self.intended_heading), self.tack_within_degrees
-        )
-        turn_above_heading = self.minus_wrap(
-            self.plus_wrap(180.0, self.intended_heading), self.tack_within_degrees
-        )
-        if turn_below_heading < turn_above_heading:
-            turn_below_heading = 360.0
+        turn_above_heading = self._turn_above
+        turn_below_heading = self._turn_below
+        intended = self._intended_heading
+        time_adjusted = self.time_adjusted
+        last_turn = self.last_turn
 
         should_turn = self.should_turn(
             wind_heading, turn_above_heading, turn_below_heading, current_heading
         )
 
-        if should_turn == Turn.LEFT and (
-            not self.time_adjusted
-            or (timestamp - self.tack_time_hours) > self.time_adjusted
-        ):
-            # print(
-            #     f"Adjusting: turning left ({wind_heading} > {turn_above_heading} and {current_heading} within acceptable deviation of {self.intended_heading})"
-            # )
-            adjustment = 45.0
-            new_heading = self.plus_wrap(self.intended_heading, adjustment)
-            # adjustment = wind_heading - turn_above_heading + 40.0
-            # new_heading = self.plus_wrap(current_heading, adjustment)
-            # print(f"Adjusting {current_heading} by {adjustment} for {new_heading}")
-            # new_heading = self.plus_wrap(
-            #     current_heading,
-            #     self.plus_wrap(
-            #         wind_heading,
-            #         self.plus_wrap(self.intended_heading, 180.0),
-            #     ),
-            # )
-            # print(f"New heading: {new_heading}")
-            if self.last_turn == Turn.LEFT:
-                self.last_turn = Turn.RIGHT
-                new_heading = self.minus_wrap(new_heading, 90.0)
-                # print(f"Tacking to {new_heading}")
-            else:
-                self.last_turn = Turn.LEFT
-                # print("Not tacking - last turn was left")
-            self.time_adjusted = timestamp
-            return Heading(new_heading)
-        elif should_turn == Turn.RIGHT and (
-            not self.time_adjusted
-            or (timestamp - self.tack_time_hours) > self.time_adjusted
+        # Holding course is by far the most common outcome, so handle it first
+        if should_turn == Turn.NO or (
+            time_adjusted and (timestamp - self.tack_time_hours) <= time_adjusted
         ):
-            # print(
-            #     f"Adjusting: turning right ({wind_heading} < {turn_above_heading} and {current_heading} within acceptable deviation of {self.intended_heading})"
-            # )
-            adjustment = 45.0
-            new_heading = self.minus_wrap(self.intended_heading, adjustment)
-            # adjustment = turn_below_heading - wind_heading + 40.0
-            # new_heading = self.minus_wrap(current_heading, adjustment)
-            # print(f"Adjusting {current_heading} by {adjustment} for {new_heading}")
-            # new_heading = self.minus_wrap(
-            #     current_heading,
-            #     self.minus_wrap(
-            #         wind_heading,
-            #         self.plus_wrap(self.intended_heading, 180.0),
-            #     ),
-            # )
-            # print(f"New heading: {new_heading}")
-            if self.last_turn == Turn.RIGHT:
-                self.last_turn = Turn.LEFT
-                new_heading = self.plus_wrap(new_heading, 90.0)
-                # print(f"Tacking to {new_heading}")
-            else:
-                self.last_turn = Turn.RIGHT
-                # print("Not tacking - last turn was right")
-            self.time_adjusted = timestamp
-            return Heading(new_heading)
-        else:
             self.time_adjusted = None
-            # print(
-            #     f"Should not turn: {wind_heading} !> {turn_above_heading} and {wind_heading} !< {turn_below_heading} and {current_heading} <=> {self.intended_heading}"
-            # )
-            return Heading(self.intended_heading)
-
-    def minus_wrap(self, a: float, b: float) -> float:
-        """a - b, wrapped around to 360.0 at 0.0"""
-        res = a - b
-        if res < 0.0:
-            return res + 360.0
-        else:
-            return res
+            return Heading(intended)
 
-    def plus_wrap(self, a: float, b: float) -> float:
-        """a + b, wrapped around at 360.0"""
-        res = a + b
-        if res > 360.0:
-            return res - 360.0
-        else:
-            return res
+        new_heading, self.last_turn = _tack_heading(intended, should_turn, last_turn)
+        self.time_adjusted = timestamp
+        return Heading(new_heading)
+
+    def _recompute_bounds(self) -> None:
+        """Wind window around the reverse of intended_heading that makes us tack"""
+        mid = (180.0 + self._intended_heading) % 360.0
+        turn_below_heading = (mid + self.tack_within_degrees) % 360.0
+        turn_above_heading = (mid - self.tack_within_degrees) % 360.0
+        if turn_below_heading < turn_above_heading:
+            turn_below_heading = 360.0
+        self._turn_above = turn_above_heading
+        self._turn_below = turn_below_heading
 
     def within_acceptable_deviation(self, current_heading: float) -> bool:
-        if current_heading > self.minus_wrap(
-            self.intended_heading, 45.0
-        ) and current_heading < self.plus_wrap(self.intended_heading, 45.0):
-            return True
-        else:
-            return False
+        """True if current_heading is less than 45 degrees off the intended heading"""
+        return (
+            abs((current_heading - self._intended_heading + 180.0) % 360.0 - 180.0)
+            < 45.0
+        )
 
     def wind_heading(self, horizontal: float, vertical: float) -> float:
-        # r = np.sqrt(pow(horizontal, 2) + pow(vertical, 2))
-        phi = np.rad2deg(np.arctan2(vertical, horizontal))
-        # orig_phi = phi
+        phi = degrees(atan2(vertical, horizontal))
         if phi < 0:
             phi = -phi
-        # else:
-        #     phi = phi + 180.0
-
-        # print(
-        #     f"Wind r: {r}, wind phi: {orig_phi}, corrected phi: {phi}, return heading {360.0-phi if phi != 0.0 else phi}"
-        # )
         if phi == 0.0:
             return phi
         else: